@@ -2803,7 +2803,7 @@ class BinFile(object):
                 headloss = np.array(df['headloss'])
                 headloss[:, linktype < 2] = to_si(self.flow_units, headloss[:, linktype < 2], HydParam.HeadLoss) # Pipe or CV
                 headloss[:, linktype >= 2] = to_si(self.flow_units, headloss[:, linktype >= 2], HydParam.Length) # Pump or Valve
-                self.results.link["headloss"] = pd.DataFrame(data=headloss, columns=linknames, index=reporttimes)
+                self.results.link["headloss"] = pd.DataFrame(data=headloss, columns=linknames, index=df.index)
         
                 status = np.array(df['linkstatus'])
                 if self.convert_status:
@@ -2811,7 +2811,7 @@ class BinFile(object):
                     status[status == 3] = 1
                     status[status >= 5] = 1
                     status[status == 4] = 2
-                self.results.link['status'] = pd.DataFrame(data=status, columns=linknames, index=reporttimes)
+                self.results.link['status'] = pd.DataFrame(data=status, columns=linknames, index=df.index)
                 
                 setting = np.array(df['linksetting'])
                 # pump setting is relative speed (unitless)
@@ -2821,7 +2821,7 @@ class BinFile(object):
                 setting[:, linktype == EN.PSV] = to_si(self.flow_units, setting[:, linktype == EN.PSV], HydParam.Pressure)
                 setting[:, linktype == EN.PBV] = to_si(self.flow_units, setting[:, linktype == EN.PBV], HydParam.Pressure)
                 setting[:, linktype == EN.FCV] = to_si(self.flow_units, setting[:, linktype == EN.FCV], HydParam.Flow)
-                self.results.link['setting'] = pd.DataFrame(data=setting, columns=linknames, index=reporttimes)
+                self.results.link['setting'] = pd.DataFrame(data=setting, columns=linknames, index=df.index)
                 
                 self.results.link['friction_factor'] = df['frictionfactor']
                 self.results.link['reaction_rate'] = QualParam.ReactionRate._to_si(self.flow_units, df['reactionrate'],self.mass_units) 
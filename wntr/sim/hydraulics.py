@@ -303,14 +303,16 @@ def get_results(wn, results, node_res, link_res):
     nlinks = wn.num_links
     node_names = wn.junction_name_list + wn.tank_name_list + wn.reservoir_name_list
     link_names = wn.pipe_name_list + wn.head_pump_name_list + wn.power_pump_name_list + wn.valve_name_list
+    # Build the time index once so every node and link DataFrame shares it
+    time_index = pd.Index(results.time)
 
     for key, value in node_res.items():
-        node_res[key] = pd.DataFrame(data=np.array([node_res[key][name] for name in node_names]).transpose(), index=results.time,
+        node_res[key] = pd.DataFrame(data=np.array([node_res[key][name] for name in node_names]).transpose(), index=time_index,
                                      columns=node_names)
     results.node = node_res
 
     for key, value in link_res.items():
-        link_res[key] = pd.DataFrame(data=np.array([link_res[key][name] for name in link_names]).transpose(), index=results.time,
+        link_res[key] = pd.DataFrame(data=np.array([link_res[key][name] for name in link_names]).transpose(), index=time_index,
                                             columns=link_names)
     results.link = link_res
     
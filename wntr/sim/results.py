@@ -21,3 +21,21 @@ class SimulationResults(object):
         self.network_name = None
         self.link = None
         self.node = None
+
+    def astype(self, dtype):
+        """
+        Convert the link and node results to a different data type, in place.
+
+        Casting to ``np.float32`` halves the memory used by the results,
+        which is useful when many scenarios are kept for analysis.
+
+        Parameters
+        ----------
+        dtype : data type
+            NumPy or pandas data type, for example ``np.float32``
+        """
+        for results in (self.link, self.node):
+            if results is None:
+                continue
+            for key in list(results.keys()):
+                results[key] = results[key].astype(dtype)
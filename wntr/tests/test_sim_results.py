@@ -1,5 +1,8 @@
 import unittest
 from os.path import abspath, dirname, join
+
+import numpy as np
+from pandas.testing import assert_frame_equal
 #import matplotlib.pylab as plt
 import wntr
 
@@ -44,7 +47,21 @@ class TestSimulationResults(unittest.TestCase):
     @classmethod
     def tearDownClass(self):
         pass
- 
+
+    def test_astype(self):
+        sim = wntr.sim.EpanetSimulator(self.wn)
+        results = sim.run_sim()
+        expected = results.link['flowrate'].copy()
+
+        results.astype(np.float32)
+
+        for key in results.node.keys():
+            self.assertTrue((results.node[key].dtypes == np.float32).all())
+        for key in results.link.keys():
+            self.assertTrue((results.link[key].dtypes == np.float32).all())
+        assert_frame_equal(results.link['flowrate'], expected, check_dtype=False,
+                           rtol=1e-5, atol=1e-6)
+
 
 
 if __name__ == "__main__":